@@ -2,19 +2,27 @@
 pyPPC CLI Commands
 """
 
-from .validate import cmd_validate
-from .format import cmd_format
-from .convert import cmd_to_json, cmd_to_yaml
-from .get import cmd_get
-from .env import cmd_env
-from .init import cmd_init
+from importlib import import_module
 
-__all__ = [
-    "cmd_validate",
-    "cmd_format",
-    "cmd_to_json",
-    "cmd_to_yaml",
-    "cmd_get",
-    "cmd_env",
-    "cmd_init",
-]
+# Command name -> submodule that defines it. Submodules are imported
+# lazily (PEP 562) so one invocation only pays for the command it runs.
+_COMMAND_MODULES = {
+    "cmd_validate": "validate",
+    "cmd_format": "format",
+    "cmd_to_json": "convert",
+    "cmd_to_yaml": "convert",
+    "cmd_get": "get",
+    "cmd_env": "env",
+    "cmd_init": "init",
+}
+
+__all__ = list(_COMMAND_MODULES)
+
+
+def __getattr__(name):
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = command  # Cache for subsequent lookups
+    return command
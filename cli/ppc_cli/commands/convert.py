@@ -3,63 +3,121 @@ Convert commands (to-json, to-yaml)
 """
 
 import json
-from pathlib import Path
+import sys
 from typing import Any, Dict
 
-from ppc import load
-
 from ..i18n import t
 
+# Characters that force a string value to be quoted in YAML output
+_YAML_SPECIALS = frozenset(':#\'"\n')
+
+# JSON encoders cached per indent so repeated conversions reuse them
+_json_encoders: Dict[int, json.JSONEncoder] = {}
+
+
+def _json_encoder(indent: int) -> json.JSONEncoder:
+    encoder = _json_encoders.get(indent)
+    if encoder is None:
+        encoder = _json_encoders[indent] = json.JSONEncoder(
+            indent=indent, ensure_ascii=False
+        )
+    return encoder
+
 
 def cmd_to_json(args) -> int:
     """Convert .ppc to JSON."""
-    path = Path(args.file)
-    config = load(path)
+    from ppc import load
+
+    config = load(args.file)
     data = config.to_dict()
 
-    output = json.dumps(data, indent=args.indent, ensure_ascii=False)
+    encoder = _json_encoder(args.indent)
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(output)
+        with open(args.output, "w", encoding="utf-8", buffering=64 * 1024) as f:
+            for chunk in encoder.iterencode(data):
+                f.write(chunk)
         print(t("convert.success", path=args.output))
     else:
-        print(output)
+        write = sys.stdout.write
+        for chunk in encoder.iterencode(data):
+            write(chunk)
+        write("\n")
 
     return 0
 
 
 def cmd_to_yaml(args) -> int:
-    """Convert .ppc to YAML (simple implementation)."""
-    path = Path(args.file)
-    config = load(path)
+    """Convert .ppc to YAML.
+
+    Uses PyYAML (with the libyaml C dumper when compiled in) if it is
+    installed; otherwise falls back to the built-in dependency-free
+    serializer below.
+    """
+    from ppc import load
+
+    config = load(args.file)
     data = config.to_dict()
 
-    output = _dict_to_yaml(data)
+    try:
+        import yaml
+    except ImportError:
+        yaml = None
+
+    if yaml is not None:
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        text = yaml.dump(
+            data, Dumper=dumper, sort_keys=False, allow_unicode=True
+        )
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text)
+            print(t("convert.success", path=args.output))
+        else:
+            sys.stdout.write(text)
+        return 0
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(output)
+        with open(args.output, "w", encoding="utf-8", buffering=64 * 1024) as f:
+            _write_yaml(data, f.write)
         print(t("convert.success", path=args.output))
     else:
-        print(output)
+        _write_yaml(data, sys.stdout.write)
+        sys.stdout.write("\n")
 
     return 0
 
 
-def _dict_to_yaml(data: Dict, indent: int = 0) -> str:
-    """Simple dict to YAML converter (no external deps)."""
-    lines = []
+def _write_yaml(data: Dict, write) -> None:
+    """Stream YAML lines to a writer without building the full string."""
+    lines: list = []
+    _yaml_lines(data, lines)
+    first = True
+    for line in lines:
+        if not first:
+            write("\n")
+        write(line)
+        first = False
+
+
+def _yaml_lines(data: Dict, lines: list, indent: int = 0) -> None:
+    """Simple dict to YAML converter (no external deps).
+
+    Appends into a single shared ``lines`` list so nested sections cost
+    O(1) per line instead of being re-copied at every nesting level.
+    Uses exact-type checks: the evaluator only ever produces builtin
+    dict/list/str/bool values, and type(x) is a single pointer compare.
+    """
     prefix = "  " * indent
 
     for key, value in data.items():
-        if isinstance(value, dict):
+        if type(value) is dict:
             lines.append(f"{prefix}{key}:")
-            lines.append(_dict_to_yaml(value, indent + 1))
-        elif isinstance(value, list):
+            _yaml_lines(value, lines, indent + 1)
+        elif type(value) is list:
             lines.append(f"{prefix}{key}:")
             for item in value:
-                if isinstance(item, dict):
+                if type(item) is dict:
                     lines.append(f"{prefix}  -")
                     for k, v in item.items():
                         lines.append(f"{prefix}    {k}: {_yaml_value(v)}")
@@ -68,17 +126,15 @@ def _dict_to_yaml(data: Dict, indent: int = 0) -> str:
         else:
             lines.append(f"{prefix}{key}: {_yaml_value(value)}")
 
-    return "\n".join(lines)
-
 
 def _yaml_value(value: Any) -> str:
     """Format value for YAML."""
     if value is None:
         return "null"
-    if isinstance(value, bool):
+    if type(value) is bool:
         return "true" if value else "false"
-    if isinstance(value, str):
-        if any(c in value for c in [":", "#", "'", '"', "\n"]):
+    if type(value) is str:
+        if not _YAML_SPECIALS.isdisjoint(value):
             return f'"{value}"'
         return value
     return str(value)
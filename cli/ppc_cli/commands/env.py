@@ -2,24 +2,36 @@
 Env command
 """
 
+import mmap
 import os
 import re
 import sys
-from pathlib import Path
 
 from ..i18n import t
 
 
+# Compiled once at import; cmd_env may be invoked for many files in a row.
+# A single bytes-mode alternation finds both kinds of reference in one pass
+# over the memory-mapped file, without decoding the whole text.
+_VAR_RE = re.compile(rb'\$(env|secret)\.([A-Za-z_][A-Za-z0-9_]*)')
+
+
 def cmd_env(args) -> int:
     """List required environment variables."""
-    path = Path(args.file)
-
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
+    path = args.file
 
-    # Find all $env.VAR patterns
-    env_vars = set(re.findall(r'\$env\.([A-Za-z_][A-Za-z0-9_]*)', text))
-    secrets = set(re.findall(r'\$secret\.([A-Za-z_][A-Za-z0-9_]*)', text))
+    # Find all $env.VAR / $secret.VAR patterns
+    env_vars = set()
+    secrets = set()
+    targets = {b"env": env_vars, b"secret": secrets}
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file or mmap-unfriendly filesystem
+            buffer = f.read()
+        for match in _VAR_RE.finditer(buffer):
+            targets[match.group(1)].add(match.group(2).decode("ascii"))
 
     if args.check:
         missing_env = []
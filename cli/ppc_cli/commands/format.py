@@ -2,16 +2,14 @@
 Format command
 """
 
-from pathlib import Path
-
-from ppc import loads, dumps
-
 from ..i18n import t
 
 
 def cmd_format(args) -> int:
     """Format a .ppc file."""
-    path = Path(args.file)
+    from ppc import loads, dumps
+
+    path = args.file
 
     with open(path, "r", encoding="utf-8") as f:
         text = f.read()
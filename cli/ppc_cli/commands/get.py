@@ -4,16 +4,19 @@ Get command
 
 import json
 import sys
-from pathlib import Path
-
-from ppc import load
 
 from ..i18n import t
 
 
+# One encoder per process instead of one per json.dumps call
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
 def cmd_get(args) -> int:
     """Get a value by key path."""
-    path = Path(args.file)
+    from ppc import load
+
+    path = args.file
     config = load(path)
 
     value = config.get_nested(args.key)
@@ -22,9 +25,9 @@ def cmd_get(args) -> int:
         return 1
 
     if hasattr(value, "to_dict"):
-        print(json.dumps(value.to_dict(), indent=2, ensure_ascii=False))
+        print(_ENCODER.encode(value.to_dict()))
     elif isinstance(value, (list, dict)):
-        print(json.dumps(value, indent=2, ensure_ascii=False))
+        print(_ENCODER.encode(value))
     else:
         print(value)
 
@@ -54,6 +54,10 @@ TEMPLATES = {
 }
 
 
+# Encoded once at import so cmd_init can write bytes directly
+TEMPLATES_BYTES = {name: text.encode("utf-8") for name, text in TEMPLATES.items()}
+
+
 def cmd_init(args) -> int:
     """Create a new .ppc file from template."""
     output = Path(args.output)
@@ -62,9 +66,9 @@ def cmd_init(args) -> int:
         print(t("init.exists", path=output), file=sys.stderr)
         return 1
 
-    template_content = TEMPLATES.get(args.template, TEMPLATES["minimal"])
+    template_content = TEMPLATES_BYTES.get(args.template, TEMPLATES_BYTES["minimal"])
 
-    with open(output, "w", encoding="utf-8") as f:
+    with open(output, "wb") as f:
         f.write(template_content)
 
     print(t("init.success", path=output))
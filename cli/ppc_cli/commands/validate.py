@@ -2,34 +2,34 @@
 Validate command
 """
 
-from pathlib import Path
-
-from ppc import load
-from ppc.lexer import tokenize
-from ppc.parser import parse
-from ppc.exceptions import PPCError
-
 from ..i18n import t
 
 
 def cmd_validate(args) -> int:
     """Validate a .ppc file."""
-    path = Path(args.file)
+    from ppc.parser import parse
+    from ppc.exceptions import PPCError
+
+    path = args.file
 
     try:
         with open(path, "r", encoding="utf-8") as f:
             text = f.read()
 
-        # Try to parse
-        tokens = tokenize(text)
-        ast = parse(text)
+        # A single parse covers tokenization and syntax in one pass
+        parse(text)
+
+        # --strict also evaluates the file, catching type-hint and
+        # conditional errors that only surface at load time; to_dict
+        # forces deferred @when sections so their errors surface too
+        if args.strict:
+            from ppc import load
 
-        # Try to load
-        try:
-            config = load(path)
-        except PPCError as e:
-            if "not found" not in str(e).lower():
-                raise
+            try:
+                load(path).to_dict()
+            except PPCError as e:
+                if "not found" not in str(e).lower():
+                    raise
 
         print(t("validate.success", path=path))
         return 0
@@ -2,6 +2,7 @@
 pyPPC CLI - Internationalization (i18n)
 """
 
+import functools
 import locale
 import os
 from typing import Dict, Optional
@@ -15,26 +16,50 @@ LANGUAGES = {
     "en": EN_MESSAGES,
 }
 
+
+def _flatten(messages: Dict, prefix: str = "") -> Dict[str, str]:
+    """Flatten nested message dicts into {"a.b.c": "..."} form."""
+    flat = {}
+    for key, value in messages.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{full_key}."))
+        else:
+            flat[full_key] = value
+    return flat
+
+
+# Precomputed flat maps so t() is a single dict lookup
+_FLAT = {lang: _flatten(messages) for lang, messages in LANGUAGES.items()}
+_FLAT_EN = _FLAT["en"]
+
 # Current language
 _current_lang = "en"
 
 
+@functools.lru_cache(maxsize=1)
+def _system_language() -> Optional[str]:
+    """Probe the system locale once; the result cannot change mid-process."""
+    try:
+        system_lang = locale.getdefaultlocale()[0]
+        if system_lang:
+            return system_lang.split("_")[0].lower()
+    except Exception:
+        pass
+    return None
+
+
 def detect_language() -> str:
     """Detect system language."""
-    # Check environment variable first
+    # Check environment variable first (skips the locale probe entirely)
     env_lang = os.environ.get("PPC_LANG", "").lower()
     if env_lang in LANGUAGES:
         return env_lang
 
     # Check system locale
-    try:
-        system_lang = locale.getdefaultlocale()[0]
-        if system_lang:
-            lang_code = system_lang.split("_")[0].lower()
-            if lang_code in LANGUAGES:
-                return lang_code
-    except Exception:
-        pass
+    lang_code = _system_language()
+    if lang_code in LANGUAGES:
+        return lang_code
 
     return "en"
 
@@ -64,31 +89,22 @@ def t(key: str, **kwargs) -> str:
     Returns:
         Translated message
     """
-    messages = LANGUAGES.get(_current_lang, EN_MESSAGES)
-
-    # Navigate nested keys
-    parts = key.split(".")
-    value = messages
-    for part in parts:
-        if isinstance(value, dict) and part in value:
-            value = value[part]
-        else:
-            # Fallback to English
-            value = EN_MESSAGES
-            for p in parts:
-                if isinstance(value, dict) and p in value:
-                    value = value[p]
-                else:
-                    return key  # Return key if not found
-            break
-
-    if isinstance(value, str):
-        try:
-            return value.format(**kwargs)
-        except KeyError:
-            return value
-
-    return key
+    messages = _FLAT.get(_current_lang, _FLAT_EN)
+
+    value = messages.get(key)
+    if value is None:
+        # Fallback to English
+        value = _FLAT_EN.get(key)
+        if value is None:
+            return key  # Return key if not found
+
+    if not kwargs:
+        return value
+
+    try:
+        return value.format(**kwargs)
+    except KeyError:
+        return value
 
 
 # Auto-detect language on import
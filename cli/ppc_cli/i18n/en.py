@@ -28,6 +28,7 @@ MESSAGES = {
         "indent": "JSON indent (default: 2)",
         "key": "Key path (e.g., bot.token)",
         "check": "Check if all env vars are set",
+        "strict": "Also evaluate the file (types, env vars, conditionals)",
         "template": "Template type",
         "lang": "Set language (ja/en)",
     },
@@ -28,6 +28,7 @@ MESSAGES = {
         "indent": "JSONのインデント幅 (デフォルト: 2)",
         "key": "キーのパス (例: bot.token)",
         "check": "全ての環境変数が設定されているかチェックする",
+        "strict": "評価まで行い型・環境変数・条件も検証する",
         "template": "テンプレートの種類",
         "lang": "言語を指定する (ja/en)",
     },
@@ -20,9 +20,124 @@ from .commands import (
     cmd_init,
 )
 
+# Subcommand name -> handler, resolved with a single dict lookup
+COMMANDS = {
+    "validate": cmd_validate,
+    "format": cmd_format,
+    "to-json": cmd_to_json,
+    "to-yaml": cmd_to_yaml,
+    "get": cmd_get,
+    "env": cmd_env,
+    "init": cmd_init,
+}
 
-def main():
-    """Main entry point for CLI."""
+# Fast-path argument specs mirroring the argparse tree below:
+# command -> (positional names, option defaults, option -> (dest, takes_value))
+_FAST_SPECS = {
+    "validate": (
+        ("file",),
+        {"strict": False},
+        {"--strict": ("strict", False)},
+    ),
+    "format": (
+        ("file",),
+        {"write": False},
+        {"-w": ("write", False), "--write": ("write", False)},
+    ),
+    "to-json": (
+        ("file",),
+        {"output": None, "indent": 2},
+        {
+            "-o": ("output", True),
+            "--output": ("output", True),
+            "--indent": ("indent", True),
+        },
+    ),
+    "to-yaml": (
+        ("file",),
+        {"output": None},
+        {"-o": ("output", True), "--output": ("output", True)},
+    ),
+    "get": (("file", "key"), {}, {}),
+    "env": (("file",), {"check": False}, {"--check": ("check", False)}),
+    "init": (
+        (),
+        {"output": "config.ppc", "template": "minimal"},
+        {
+            "-o": ("output", True),
+            "--output": ("output", True),
+            "-t": ("template", True),
+            "--template": ("template", True),
+        },
+    ),
+}
+
+
+def _parse_fast(argv):
+    """
+    Parse the common ``ppc <command> ...`` invocations without argparse.
+
+    Building the full argparse tree dominates startup for short commands,
+    so well-formed calls are handled here. Returns None for anything this
+    parser doesn't fully understand (-h, unknown options, bad values);
+    the caller then falls back to argparse for proper help and errors.
+    """
+    if not argv:
+        return None
+    spec = _FAST_SPECS.get(argv[0])
+    if spec is None:
+        return None
+    positional_names, defaults, options = spec
+
+    values = dict(defaults)
+    values["command"] = argv[0]
+    values["lang"] = None
+    positionals = []
+
+    i = 1
+    n = len(argv)
+    while i < n:
+        arg = argv[i]
+        if arg.startswith("-"):
+            entry = ("lang", True) if arg == "--lang" else options.get(arg)
+            if entry is None:
+                return None
+            dest, takes_value = entry
+            if takes_value:
+                i += 1
+                if i >= n:
+                    return None
+                values[dest] = argv[i]
+            else:
+                values[dest] = True
+        else:
+            positionals.append(arg)
+        i += 1
+
+    if len(positionals) != len(positional_names):
+        return None
+    values.update(zip(positional_names, positionals))
+
+    # Validate choice/typed options the way argparse would
+    if values["lang"] is not None and values["lang"] not in LANGUAGES:
+        return None
+    if values["command"] == "init" and values["template"] not in (
+        "minimal",
+        "bot",
+        "web",
+    ):
+        return None
+    if values["command"] == "to-json":
+        try:
+            values["indent"] = int(values["indent"])
+        except (TypeError, ValueError):
+            return None
+
+    return argparse.Namespace(**values)
+
+
+def _parse_full():
+    """Build the full argparse tree and parse sys.argv with it."""
     # Pre-parse for language option
     if "--lang" in sys.argv:
         idx = sys.argv.index("--lang")
@@ -52,6 +167,11 @@ def main():
         help=t("commands.validate"),
     )
     validate_parser.add_argument("file", help=t("args.file"))
+    validate_parser.add_argument(
+        "--strict",
+        action="store_true",
+        help=t("args.strict"),
+    )
 
     # format
     format_parser = subparsers.add_parser(
@@ -132,31 +252,26 @@ def main():
 
     args = parser.parse_args()
 
-    # Apply language if specified
-    if args.lang:
-        set_language(args.lang)
-
     if args.command is None:
         parser.print_help()
         sys.exit(0)
 
+    return args
+
+
+def main():
+    """Main entry point for CLI."""
+    args = _parse_fast(sys.argv[1:])
+    if args is None:
+        args = _parse_full()
+
+    # Apply language if specified
+    if args.lang:
+        set_language(args.lang)
+
     try:
-        exit_code = 0
-
-        if args.command == "validate":
-            exit_code = cmd_validate(args)
-        elif args.command == "format":
-            exit_code = cmd_format(args)
-        elif args.command == "to-json":
-            exit_code = cmd_to_json(args)
-        elif args.command == "to-yaml":
-            exit_code = cmd_to_yaml(args)
-        elif args.command == "get":
-            exit_code = cmd_get(args)
-        elif args.command == "env":
-            exit_code = cmd_env(args)
-        elif args.command == "init":
-            exit_code = cmd_init(args)
+        handler = COMMANDS.get(args.command)
+        exit_code = handler(args) if handler else 0
 
         sys.exit(exit_code)
 
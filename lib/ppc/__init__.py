@@ -22,21 +22,11 @@ except ImportError:
 
 __author__ = "pyPPC"
 
+import re
+from importlib import import_module
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, Callable
 
-from .config import Config, ConfigSection
-from .parser import parse, AST
-from .evaluator import Evaluator
-from .lexer import tokenize
-from .secrets import (
-    SecretProvider,
-    EnvSecretProvider,
-    FileSecretProvider,
-    DictSecretProvider,
-    ChainedSecretProvider,
-    create_secret_provider,
-)
 from .exceptions import (
     PPCError,
     LexerError,
@@ -47,6 +37,33 @@ from .exceptions import (
     SecretError,
 )
 
+# Re-exported names -> defining submodule, resolved lazily via PEP 562 so
+# that ``import ppc`` (e.g. for __version__ or the exceptions) doesn't pay
+# for the lexer/parser/evaluator import chain until something needs it
+_LAZY_IMPORTS = {
+    "Config": "config",
+    "ConfigSection": "config",
+    "parse": "parser",
+    "AST": "parser",
+    "Evaluator": "evaluator",
+    "tokenize": "lexer",
+    "SecretProvider": "secrets",
+    "EnvSecretProvider": "secrets",
+    "FileSecretProvider": "secrets",
+    "DictSecretProvider": "secrets",
+    "ChainedSecretProvider": "secrets",
+    "create_secret_provider": "secrets",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 def load(
     path: Union[str, Path],
@@ -54,7 +71,7 @@ def load(
     secret_provider: Optional[Callable[[str], Optional[str]]] = None,
     secrets_file: Optional[Union[str, Path]] = None,
     secrets: Optional[Dict[str, str]] = None,
-) -> Config:
+) -> "Config":
     """
     Load a pepeconfig file.
 
@@ -71,16 +88,19 @@ def load(
         config = load("bot.ppc")
         print(config.bot.token)
     """
-    path = Path(path)
+    from ._cache import load_cached_ast, store_cached_ast
+    from .evaluator import Evaluator
+    from .parser import parse
 
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
+    path = Path(path)
 
     # Create secret provider if needed
     provider = None
     if secret_provider:
         provider = secret_provider
     elif secrets_file or secrets:
+        from .secrets import create_secret_provider
+
         sp = create_secret_provider(
             env=True,
             file_path=Path(secrets_file) if secrets_file else None,
@@ -88,7 +108,12 @@ def load(
         )
         provider = sp.get
 
-    ast = parse(text)
+    # Opt-in disk cache (PPC_AST_CACHE=1) for repeated CLI invocations
+    ast = load_cached_ast(path)
+    if ast is None:
+        ast = parse(path.read_text(encoding="utf-8"))
+        store_cached_ast(path, ast)
+
     evaluator = Evaluator(base_path=path.parent, secret_provider=provider)
     return evaluator.evaluate(ast)
 
@@ -99,7 +124,7 @@ def loads(
     base_path: Optional[Union[str, Path]] = None,
     secret_provider: Optional[Callable[[str], Optional[str]]] = None,
     secrets: Optional[Dict[str, str]] = None,
-) -> Config:
+) -> "Config":
     """
     Load pepeconfig from a string.
 
@@ -118,14 +143,23 @@ def loads(
           prefix = "!"
         ''')
     """
+    from ._cache import memoized_ast, remember_ast
+    from .evaluator import Evaluator
+    from .parser import parse
+
     provider = None
     if secret_provider:
         provider = secret_provider
     elif secrets:
+        from .secrets import DictSecretProvider
+
         sp = DictSecretProvider(secrets)
         provider = sp.get
 
-    ast = parse(text)
+    ast = memoized_ast(text)
+    if ast is None:
+        ast = parse(text)
+        remember_ast(text, ast)
     evaluator = Evaluator(
         base_path=Path(base_path) if base_path else None,
         secret_provider=provider,
@@ -133,7 +167,7 @@ def loads(
     return evaluator.evaluate(ast)
 
 
-def dump(config: Union[Config, Dict[str, Any]], path: Union[str, Path]) -> None:
+def dump(config: Union["Config", Dict[str, Any]], path: Union[str, Path]) -> None:
     """
     Dump a Config object to a .ppc file.
 
@@ -141,14 +175,10 @@ def dump(config: Union[Config, Dict[str, Any]], path: Union[str, Path]) -> None:
         config: Config object or dictionary to dump
         path: Path to write the .ppc file
     """
-    text = dumps(config)
-    path = Path(path)
-
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(text)
+    Path(path).write_text(dumps(config), encoding="utf-8")
 
 
-def dumps(config: Union[Config, Dict[str, Any]]) -> str:
+def dumps(config: Union["Config", Dict[str, Any]]) -> str:
     """
     Dump a Config object to a string.
 
@@ -158,6 +188,8 @@ def dumps(config: Union[Config, Dict[str, Any]]) -> str:
     Returns:
         The pepeconfig formatted string
     """
+    from .config import Config
+
     if isinstance(config, Config):
         data = config.to_dict()
     else:
@@ -174,30 +206,32 @@ def _dump_section(
     prefix: str,
 ) -> None:
     """Recursively dump sections."""
-    simple_items = {}
-    nested_items = {}
+    simple_lines = []
+    nested_items = []
 
     for key, value in data.items():
         if isinstance(value, dict):
-            nested_items[key] = value
+            nested_items.append((key, value))
         else:
-            simple_items[key] = value
+            simple_lines.append(f"  {key} = {_format_value(value)}")
 
     # Dump simple items first
-    if simple_items:
+    if simple_lines:
         if prefix:
             lines.append(f">> {prefix}")
-        for key, value in simple_items.items():
-            formatted = _format_value(value)
-            lines.append(f"  {key} = {formatted}")
+        lines.extend(simple_lines)
         lines.append("")
 
     # Dump nested sections
-    for key, value in nested_items.items():
+    for key, value in nested_items:
         new_prefix = f"{prefix}.{key}" if prefix else key
         _dump_section(value, lines, new_prefix)
 
 
+# Escapes backslashes and double quotes in a single scan
+_ESCAPE_RE = re.compile(r'([\\"])')
+
+
 def _format_value(value: Any) -> str:
     """Format a value for output."""
     if value is None:
@@ -206,7 +240,7 @@ def _format_value(value: Any) -> str:
         return "true" if value else "false"
     if isinstance(value, str):
         # Escape and quote string
-        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        escaped = _ESCAPE_RE.sub(r"\\\1", value)
         return f'"{escaped}"'
     if isinstance(value, (int, float)):
         return str(value)
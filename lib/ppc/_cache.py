@@ -0,0 +1,104 @@
+"""
+pyPPC - Parse-result cache
+
+Repeated CLI invocations (validate, to-json, get ...) re-parse the same
+file each time. When ``PPC_AST_CACHE=1`` is set, parsed ASTs are pickled
+under the user cache directory keyed by the absolute source path and
+validated against the file's mtime and size. Everything here is
+best-effort: on any error the caller simply parses from scratch.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+
+# Process-level AST cache keyed by content hash. Hashing the source is
+# far cheaper than lexing + parsing it, so repeated loads of identical
+# text (notably includes shared across files) hit the cache instead.
+# Cached ASTs are never mutated by the evaluator, so sharing is safe.
+_AST_CACHE = {}
+_AST_CACHE_MAX = 128
+
+
+def _text_key(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def memoized_ast(text: str) -> Optional[Any]:
+    """Return the in-process cached AST for ``text``, or None."""
+    return _AST_CACHE.get(_text_key(text))
+
+
+def remember_ast(text: str, ast: Any) -> None:
+    """Cache a parsed AST for ``text`` for the rest of the process."""
+    if len(_AST_CACHE) >= _AST_CACHE_MAX:
+        _AST_CACHE.clear()
+    _AST_CACHE[_text_key(text)] = ast
+
+
+def _enabled() -> bool:
+    return os.environ.get("PPC_AST_CACHE") == "1"
+
+
+def _cache_file(path: str) -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()
+    return Path(base) / "ppc" / f"{digest}.pkl"
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_cached_ast(path) -> Optional[Any]:
+    """Return the cached AST for ``path`` if still fresh, else None."""
+    if not _enabled():
+        return None
+
+    abs_path = os.path.abspath(str(path))
+    stat_key = _stat_key(abs_path)
+    if stat_key is None:
+        return None
+
+    try:
+        with open(_cache_file(abs_path), "rb") as f:
+            cached_key, ast = pickle.load(f)
+    except Exception:
+        return None
+
+    if cached_key != stat_key:
+        return None
+    return ast
+
+
+def store_cached_ast(path, ast) -> None:
+    """Persist a parsed AST for ``path``; silently skips on any error."""
+    if not _enabled():
+        return
+
+    abs_path = os.path.abspath(str(path))
+    stat_key = _stat_key(abs_path)
+    if stat_key is None:
+        return
+
+    cache_file = _cache_file(abs_path)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump((stat_key, ast), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
@@ -0,0 +1,27 @@
+"""
+pyPPC - Shared internal helpers
+"""
+
+from typing import Dict
+
+
+def deep_merge(base: Dict, override: Dict) -> None:
+    """
+    Deep merge ``override`` into ``base`` in place.
+
+    Iterative with an explicit stack, so deeply nested configs and long
+    include chains don't pay a Python frame per level or hit the
+    recursion limit.
+    """
+    stack = [(base, override)]
+    while stack:
+        base_dict, override_dict = stack.pop()
+        for key, value in override_dict.items():
+            if (
+                isinstance(value, dict)
+                and key in base_dict
+                and isinstance(base_dict[key], dict)
+            ):
+                stack.append((base_dict[key], value))
+            else:
+                base_dict[key] = value
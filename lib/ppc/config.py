@@ -2,8 +2,20 @@
 pyPPC - Config Object
 """
 
+import functools
 from typing import Any, Dict, Iterator, Optional, Union
 
+from ._util import deep_merge
+
+# Sentinel for the miss path in get_nested
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=512)
+def _split_path(path: str) -> tuple:
+    """Split a dotted path once; typical callers repeat the same paths."""
+    return tuple(path.split("."))
+
 
 class ConfigSection:
     """
@@ -11,9 +23,21 @@ class ConfigSection:
     Supports both dot notation (config.key) and dict notation (config["key"]).
     """
 
+    __slots__ = ("_data", "_name", "_cache")
+
     def __init__(self, data: Dict[str, Any] = None, name: str = ""):
         object.__setattr__(self, "_data", data or {})
         object.__setattr__(self, "_name", name)
+        # Lazily-built ConfigSection wrappers for nested dicts, so repeated
+        # traversals of the same path don't allocate a wrapper per access
+        object.__setattr__(self, "_cache", {})
+
+    def _wrap(self, key: str, value: Dict[str, Any]) -> "ConfigSection":
+        cache = self._cache
+        section = cache.get(key)
+        if section is None or section._data is not value:
+            section = cache[key] = ConfigSection(value, key)
+        return section
 
     def __getattr__(self, key: str) -> Any:
         if key.startswith("_"):
@@ -24,8 +48,8 @@ class ConfigSection:
             raise AttributeError(f"Config has no attribute '{key}'")
 
         value = data[key]
-        if isinstance(value, dict):
-            return ConfigSection(value, key)
+        if type(value) is dict:
+            return self._wrap(key, value)
         return value
 
     def __setattr__(self, key: str, value: Any) -> None:
@@ -33,15 +57,17 @@ class ConfigSection:
             object.__setattr__(self, key, value)
         else:
             self._data[key] = value
+            self._cache.pop(key, None)
 
     def __getitem__(self, key: str) -> Any:
         value = self._data[key]
-        if isinstance(value, dict):
-            return ConfigSection(value, key)
+        if type(value) is dict:
+            return self._wrap(key, value)
         return value
 
     def __setitem__(self, key: str, value: Any) -> None:
         self._data[key] = value
+        self._cache.pop(key, None)
 
     def __contains__(self, key: str) -> bool:
         return key in self._data
@@ -62,8 +88,8 @@ class ConfigSection:
         """Get a value with an optional default."""
         try:
             value = self._data.get(key, default)
-            if isinstance(value, dict):
-                return ConfigSection(value, key)
+            if type(value) is dict:
+                return self._wrap(key, value)
             return value
         except KeyError:
             return default
@@ -89,60 +115,143 @@ class Config(ConfigSection):
     """
     Root config object.
     Supports nested access via dot notation: config.section.key
+
+    Sections from matching @when conditionals are applied lazily: the
+    evaluator registers them via _set_deferred and they are merged into
+    the data the first time their top-level key (or the whole config)
+    is accessed.
     """
 
+    __slots__ = ("_deferred", "_apply")
+
     def __init__(self, data: Dict[str, Any] = None):
         super().__init__(data, "root")
+        object.__setattr__(self, "_deferred", None)
+        object.__setattr__(self, "_apply", None)
+
+    def _set_deferred(self, deferred: Dict[str, list], apply_fn) -> None:
+        """Register pending conditional sections (called by Evaluator)."""
+        object.__setattr__(self, "_deferred", deferred)
+        object.__setattr__(self, "_apply", apply_fn)
+
+    def _materialize(self, key: str = None) -> None:
+        """Apply pending conditional sections for ``key`` (or all)."""
+        deferred = self._deferred
+        if not deferred:
+            return
+        names = list(deferred) if key is None else [key] if key in deferred else []
+        for name in names:
+            for section in deferred.pop(name):
+                self._apply(section, self._data)
+            self._cache.pop(name, None)
+
+    def __getattr__(self, key: str) -> Any:
+        if not key.startswith("_"):
+            self._materialize(key)
+        return super().__getattr__(key)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        # Writes also force pending sections first, so a later deferred
+        # merge can't clobber the caller's value
+        if not key.startswith("_"):
+            self._materialize(key)
+        super().__setattr__(key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        self._materialize(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._materialize(key)
+        super().__setitem__(key, value)
+
+    def __contains__(self, key: str) -> bool:
+        self._materialize(key)
+        return super().__contains__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        self._materialize()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._materialize()
+        return super().__len__()
 
     def __repr__(self) -> str:
+        self._materialize()
         return f"Config({self._data})"
 
+    def __str__(self) -> str:
+        self._materialize()
+        return str(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value with an optional default."""
+        self._materialize(key)
+        return super().get(key, default)
+
+    def keys(self):
+        """Return config keys."""
+        self._materialize()
+        return super().keys()
+
+    def values(self):
+        """Return config values."""
+        self._materialize()
+        return super().values()
+
+    def items(self):
+        """Return config items."""
+        self._materialize()
+        return super().items()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to regular dictionary."""
+        self._materialize()
+        return dict(self._data)
+
     def merge(self, other: Union["Config", Dict[str, Any]]) -> "Config":
         """Merge another config into this one."""
+        self._materialize()
         if isinstance(other, Config):
-            other_data = other._data
+            other_data = other.to_dict()
         else:
             other_data = other
 
-        self._deep_merge(self._data, other_data)
+        deep_merge(self._data, other_data)
+        self._cache.clear()
         return self
 
-    def _deep_merge(self, base: Dict, override: Dict) -> None:
-        """Deep merge two dictionaries."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
-
     def set_nested(self, path: str, value: Any) -> None:
         """
         Set a nested value using dot notation path.
         Example: config.set_nested("database.host", "localhost")
         """
-        parts = path.split(".")
+        parts = _split_path(path)
+        self._materialize(parts[0])
         current = self._data
 
         for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+            current = current.setdefault(part, {})
 
         current[parts[-1]] = value
+        self._cache.pop(parts[0], None)
 
     def get_nested(self, path: str, default: Any = None) -> Any:
         """
         Get a nested value using dot notation path.
         Example: config.get_nested("database.host")
         """
-        parts = path.split(".")
+        parts = _split_path(path)
+        self._materialize(parts[0])
         current = self._data
 
-        try:
-            for part in parts:
-                current = current[part]
-            if isinstance(current, dict):
-                return ConfigSection(current, parts[-1])
-            return current
-        except (KeyError, TypeError):
-            return default
+        for part in parts:
+            if type(current) is not dict:
+                return default
+            current = current.get(part, _MISSING)
+            if current is _MISSING:
+                return default
+        if type(current) is dict:
+            return ConfigSection(current, parts[-1])
+        return current
@@ -2,16 +2,23 @@
 pyPPC - Evaluator
 """
 
+import copy
 import os
 import re
 from pathlib import Path
 from typing import Any, Dict, Optional, Callable
 
 from .parser import AST, ValueNode, SectionNode, ConditionalNode, parse
+from ._cache import memoized_ast, remember_ast
+from ._util import deep_merge
 from .config import Config
 from .types import PPCType, validate_type
 from .exceptions import EvaluationError, IncludeError
 
+# Condition patterns, compiled once for all @when evaluations
+_COND_CMP_RE = re.compile(r'\$env\.(\w+)\s*(==|!=)\s*["\']?([^"\']*)["\']?')
+_COND_TRUTHY_RE = re.compile(r'\$env\.(\w+)$')
+
 
 class Evaluator:
     """
@@ -23,10 +30,18 @@ class Evaluator:
         self,
         base_path: Optional[Path] = None,
         secret_provider: Optional[Callable[[str], Optional[str]]] = None,
+        included_files: Optional[set] = None,
     ):
         self.base_path = base_path or Path.cwd()
         self.secret_provider = secret_provider
-        self._included_files: set = set()
+        # Shared across the include graph so cycles are caught globally
+        self._included_files: set = (
+            included_files if included_files is not None else set()
+        )
+        # Snapshot of the environment, taken once at construction: cheaper
+        # than going through os.environ per reference and keeps one
+        # evaluation internally consistent
+        self._env: Dict[str, str] = dict(os.environ)
 
     def evaluate(self, ast: AST) -> Config:
         """Evaluate AST into Config."""
@@ -35,31 +50,39 @@ class Evaluator:
         # Process includes first
         for include in ast.includes:
             included_data = self._process_include(include.path, include.line)
-            self._deep_merge(data, included_data)
+            deep_merge(data, included_data)
 
         # Process sections
         for section in ast.sections:
             self._process_section(section, data)
 
-        # Process conditionals
+        # Conditions are cheap, so they are checked now; the matching
+        # sections themselves are evaluated lazily on first access
+        deferred: Dict[str, list] = {}
         for conditional in ast.conditionals:
             if self._evaluate_condition(conditional.condition):
                 for section in conditional.sections:
-                    self._process_section(section, data)
+                    top_name = section.name.split(".", 1)[0]
+                    if top_name:
+                        deferred.setdefault(top_name, []).append(section)
+                    else:
+                        # Root-level assignments can affect any key
+                        self._process_section(section, data)
 
-        return Config(data)
+        config = Config(data)
+        if deferred:
+            config._set_deferred(deferred, self._process_section)
+        return config
 
     def _process_section(self, section: SectionNode, data: Dict[str, Any]) -> None:
         """Process a section and add to data dict."""
         # Handle nested sections (e.g., "permissions.admin")
         parts = section.name.split(".") if section.name else []
 
-        # Navigate/create nested structure
+        # Navigate/create nested structure; setdefault probes each dict once
         current = data
         for part in parts:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+            current = current.setdefault(part, {})
 
         # Process assignments
         for assignment in section.assignments:
@@ -68,11 +91,22 @@ class Evaluator:
 
     def _evaluate_value(self, node: ValueNode) -> Any:
         """Evaluate a value node."""
+        # Fast path: plain scalar literals (the overwhelming majority of
+        # assignments) need no resolution or validation at all
+        value = node.value
+        if (
+            node.env_var is None
+            and node.secret is None
+            and node.type_hint is None
+            and type(value) is not list
+        ):
+            return value
+
         value = None
 
         # Environment variable
         if node.env_var:
-            value = os.environ.get(node.env_var)
+            value = self._env.get(node.env_var)
             if value is None and node.default:
                 value = self._evaluate_value(node.default)
             elif value is None:
@@ -84,7 +118,7 @@ class Evaluator:
                 value = self.secret_provider(node.secret)
             else:
                 # Try environment variable as fallback
-                value = os.environ.get(f"SECRET_{node.secret}")
+                value = self._env.get(f"SECRET_{node.secret}")
 
             if value is None and node.default:
                 value = self._evaluate_value(node.default)
@@ -109,22 +143,33 @@ class Evaluator:
 
     def _evaluate_array(self, arr: list) -> list:
         """Evaluate array items, resolving any env vars or secrets."""
-        result = []
-        for item in arr:
+        # Bind hot callables to locals so the per-item loop avoids
+        # repeated attribute lookups; the result is preallocated since
+        # the output length always matches the input
+        env_get = self._env.get
+        secret_provider = self.secret_provider
+        result = [None] * len(arr)
+        for i, item in enumerate(arr):
             if isinstance(item, dict):
-                if "$env" in item:
-                    val = os.environ.get(item["$env"])
-                    result.append(val)
-                elif "$secret" in item:
-                    if self.secret_provider:
-                        val = self.secret_provider(item["$secret"])
+                env_name = item.get("$env")
+                if env_name is not None:
+                    result[i] = env_get(env_name)
+                    continue
+                secret_name = item.get("$secret")
+                if secret_name is not None:
+                    if secret_provider:
+                        result[i] = secret_provider(secret_name)
                     else:
-                        val = os.environ.get(f"SECRET_{item['$secret']}")
-                    result.append(val)
-                else:
-                    result.append(item)
-            else:
-                result.append(item)
+                        result[i] = env_get(f"SECRET_{secret_name}")
+                    continue
+            elif type(item) is list:
+                # The AST may be shared across loads via the in-process
+                # memo, so nested containers are copied out: a caller
+                # mutating one Config's list must not reach the cached
+                # AST (and through it every other Config of this text)
+                result[i] = copy.deepcopy(item)
+                continue
+            result[i] = item
         return result
 
     def _evaluate_condition(self, condition: str) -> bool:
@@ -135,17 +180,14 @@ class Evaluator:
         condition = condition.strip()
 
         # Pattern: $env.VAR == "value" or $env.VAR != "value"
-        match = re.match(
-            r'\$env\.(\w+)\s*(==|!=)\s*["\']?([^"\']*)["\']?',
-            condition
-        )
+        match = _COND_CMP_RE.match(condition)
 
         if match:
             var_name = match.group(1)
             operator = match.group(2)
             expected = match.group(3)
 
-            actual = os.environ.get(var_name, "")
+            actual = self._env.get(var_name, "")
 
             if operator == "==":
                 return actual == expected
@@ -153,10 +195,10 @@ class Evaluator:
                 return actual != expected
 
         # Pattern: $env.VAR (truthy check)
-        match = re.match(r'\$env\.(\w+)$', condition)
+        match = _COND_TRUTHY_RE.match(condition)
         if match:
             var_name = match.group(1)
-            return bool(os.environ.get(var_name))
+            return bool(self._env.get(var_name))
 
         # Unknown condition - default to False
         return False
@@ -169,8 +211,9 @@ class Evaluator:
         else:
             full_path = Path(path)
 
-        # Check for circular includes
-        resolved = full_path.resolve()
+        # Check for circular includes. Pure string normalization is enough
+        # for cycle detection and avoids the stat syscalls of resolve()
+        resolved = os.path.normcase(os.path.abspath(str(full_path)))
         if resolved in self._included_files:
             raise IncludeError(f"Circular include detected: {path}", line=line)
 
@@ -178,32 +221,27 @@ class Evaluator:
 
         # Read and parse included file
         try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                text = f.read()
+            text = full_path.read_text(encoding="utf-8")
         except FileNotFoundError:
             raise IncludeError(f"Include file not found: {path}", line=line)
         except Exception as e:
             raise IncludeError(f"Error reading include file: {e}", line=line)
 
-        # Parse and evaluate included file
-        included_ast = parse(text)
+        # Parse and evaluate included file; identical include text shared
+        # across files is parsed once per process
+        included_ast = memoized_ast(text)
+        if included_ast is None:
+            included_ast = parse(text)
+            remember_ast(text, included_ast)
         included_evaluator = Evaluator(
             base_path=full_path.parent,
             secret_provider=self.secret_provider,
+            included_files=self._included_files,
         )
-        included_evaluator._included_files = self._included_files
 
         included_config = included_evaluator.evaluate(included_ast)
         return included_config.to_dict()
 
-    def _deep_merge(self, base: Dict, override: Dict) -> None:
-        """Deep merge two dictionaries."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
-
 
 def evaluate(ast: AST, base_path: Optional[Path] = None) -> Config:
     """Convenience function to evaluate AST."""
@@ -3,11 +3,50 @@ pyPPC - Lexer (Tokenizer)
 """
 
 import re
+import sys
 from enum import Enum, auto
-from dataclasses import dataclass
 from typing import List, Optional, Iterator
 from .exceptions import LexerError
 
+# Anchored scan patterns, compiled once. A single master alternation
+# can't tokenize PPC (key vs unquoted value depends on context), but the
+# per-character runs inside each state are regular, so pattern.match(text,
+# pos) moves those inner loops into the C regex engine.
+_WS_RUN_RE = re.compile(r"[ \t]*")
+_NAME_RES = {
+    "_": re.compile(r"\w*"),
+    "_-": re.compile(r"[\w-]*"),
+    "": re.compile(r"[^\W_]*"),
+}
+_UNTIL_RES = {
+    "\n": re.compile(r"[^\n]*"),
+    "\n#": re.compile(r"[^\n#]*"),
+    " \t\n#,]?": re.compile(r"[^ \t\n#,\]?]*"),
+}
+
+# O(1) membership sets for the remaining character tests
+_WS = frozenset(" \t")
+_QUOTES = frozenset("\"'")
+_DIGITS = frozenset("0123456789")
+_NUM_CHARS = "0123456789._+-eE"
+# Characters whose presence in an array body forces the full scanner
+_ARRAY_SLOW_CHARS = frozenset("[\"'$#?\n")
+
+
+def _maybe_number(value: str) -> bool:
+    """Cheap classifier: False means ``value`` is certainly not numeric.
+
+    Letting int()/float() raise ValueError just to classify costs about
+    a microsecond per bare word; a digit test plus a C-level strip over
+    the numeric alphabet rejects those up front. Candidates that pass
+    still go through the real conversion check.
+    """
+    if value.isascii():
+        return not _DIGITS.isdisjoint(value) and not value.strip(_NUM_CHARS)
+    # int()/float() also accept non-ASCII decimal digits (e.g. arabic
+    # or full-width numerals), so those go to the real conversion too
+    return any(c.isdigit() for c in value)
+
 
 class TokenType(Enum):
     """Token types for pyPPC."""
@@ -43,13 +82,62 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass
+# Enum attribute access goes through EnumMeta and is comparatively
+# slow, so hot paths use these prebound members
+_T_SECTION = TokenType.SECTION
+_T_SECTION_WHEN = TokenType.SECTION_WHEN
+_T_INCLUDE = TokenType.INCLUDE
+_T_KEY = TokenType.KEY
+_T_TYPE_HINT = TokenType.TYPE_HINT
+_T_EQUALS = TokenType.EQUALS
+_T_STRING = TokenType.STRING
+_T_NUMBER = TokenType.NUMBER
+_T_BOOLEAN = TokenType.BOOLEAN
+_T_NULL = TokenType.NULL
+_T_ENV_VAR = TokenType.ENV_VAR
+_T_SECRET = TokenType.SECRET
+_T_DEFAULT_OP = TokenType.DEFAULT_OP
+_T_LBRACKET = TokenType.LBRACKET
+_T_RBRACKET = TokenType.RBRACKET
+_T_COMMA = TokenType.COMMA
+_T_COMMENT = TokenType.COMMENT
+_T_NEWLINE = TokenType.NEWLINE
+_T_INDENT = TokenType.INDENT
+_T_EOF = TokenType.EOF
+
+
 class Token:
-    """Represents a single token."""
-    type: TokenType
-    value: str
-    line: int
-    column: int
+    """Represents a single token.
+
+    A plain __slots__ class rather than a dataclass: large configs
+    produce one instance per token, and dropping the per-instance dict
+    cuts memory considerably while speeding attribute access.
+
+    line/column stay per-token attributes on purpose. A shared
+    columnar buffer (array.array) would shave a pointer per slot, but
+    tokens are part of the public API and the parser and error paths
+    read token.line directly; with __slots__ each position is a single
+    reference, and CPython's small-int cache already shares the boxed
+    values for the common range.
+    """
+
+    __slots__ = ("type", "value", "line", "column")
+
+    def __init__(self, type: TokenType, value: str, line: int, column: int):
+        self.type = type
+        self.value = value
+        self.line = line
+        self.column = column
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Token):
+            return NotImplemented
+        return (
+            self.type == other.type
+            and self.value == other.value
+            and self.line == other.line
+            and self.column == other.column
+        )
 
     def __repr__(self) -> str:
         return f"Token({self.type.name}, {self.value!r}, L{self.line}:{self.column})"
@@ -63,52 +151,79 @@ class Lexer:
         self.pos = 0
         self.line = 1
         self.column = 1
+        self._len = len(text)
         self.tokens: List[Token] = []
 
     def _current_char(self) -> Optional[str]:
-        if self.pos >= len(self.text):
+        if self.pos >= self._len:
             return None
         return self.text[self.pos]
 
     def _peek(self, offset: int = 1) -> Optional[str]:
         pos = self.pos + offset
-        if pos >= len(self.text):
+        if pos >= self._len:
             return None
         return self.text[pos]
 
+    def _consume(self, end: int) -> str:
+        """Consume text up to ``end`` as one slice, updating line/column.
+
+        Single-slice consumption is what keeps the hot loops linear: the
+        scanners below only advance an integer index and never build
+        strings one character at a time.
+        """
+        text = self.text
+        start = self.pos
+        newline = text.rfind("\n", start, end)
+        if newline == -1:
+            self.column += end - start
+        else:
+            self.line += text.count("\n", start, end)
+            self.column = end - newline
+        self.pos = end
+        return text[start:end]
+
     def _advance(self, count: int = 1) -> str:
-        result = ""
-        for _ in range(count):
-            if self.pos < len(self.text):
-                char = self.text[self.pos]
-                result += char
-                self.pos += 1
-                if char == "\n":
-                    self.line += 1
-                    self.column = 1
-                else:
-                    self.column += 1
-        return result
+        return self._consume(min(self.pos + count, self._len))
 
     def _skip_whitespace_on_line(self) -> int:
         """Skip spaces/tabs, return count. Stops at newline."""
-        count = 0
-        while self._current_char() in (" ", "\t"):
-            self._advance()
-            count += 1
+        end = _WS_RUN_RE.match(self.text, self.pos).end()
+        count = end - self.pos
+        if count:
+            self.column += count
+            self.pos = end
         return count
 
     def _read_until(self, end_chars: str, include_end: bool = False) -> str:
-        result = ""
-        while self._current_char() is not None and self._current_char() not in end_chars:
-            result += self._advance()
-        if include_end and self._current_char() in end_chars:
-            result += self._advance()
-        return result
+        end = _UNTIL_RES[end_chars].match(self.text, self.pos).end()
+        if include_end and end < self._len:
+            end += 1
+        return self._consume(end)
+
+    def _read_name(self, extra: str = "_") -> str:
+        """Read an identifier run ([A-Za-z0-9] plus ``extra``) as one slice."""
+        end = _NAME_RES[extra].match(self.text, self.pos).end()
+        return self._consume(end)
 
     def _read_string(self, quote_char: str) -> str:
         """Read a quoted string."""
         self._advance()  # Skip opening quote
+        text = self.text
+        start = self.pos
+
+        # Fast path: closing quote with no escapes in between is one
+        # find + one slice
+        end = text.find(quote_char, start)
+        stop = self._len if end == -1 else end
+        if text.find("\\", start, stop) == -1:
+            if end == -1:
+                return self._consume(self._len)  # Unterminated: rest of text
+            result = text[start:end]
+            self._consume(end + 1)  # Include closing quote
+            return result
+
+        # Slow path: decode escapes character by character
         result = ""
         while self._current_char() is not None:
             char = self._current_char()
@@ -133,147 +248,229 @@ class Lexer:
                 result += self._advance()
         return result
 
-    def _read_array(self) -> List[Token]:
-        """Read array tokens."""
-        tokens = []
+    def _read_array(self, out: List[Token]) -> None:
+        """Read array tokens, appending them to ``out``."""
+        append = out.append
         start_line = self.line
         start_col = self.column
+        text = self.text
+
+        # Fast path: a simple single-line array like [1, 2, 3] is lexed
+        # with one find() and one split() instead of the per-char loop.
+        # Anything that needs real scanning (strings, nesting, comments,
+        # $refs, ?? defaults, newlines) falls through
+        end = text.find("]", self.pos + 1)
+        if end != -1:
+            body = text[self.pos + 1:end]
+            if not _ARRAY_SLOW_CHARS.intersection(body):
+                items = self._lex_simple_array(body, start_line, start_col)
+                if items is not None:
+                    append(Token(_T_LBRACKET, "[", start_line, start_col))
+                    out.extend(items)
+                    end_col = start_col + (end - self.pos)
+                    append(Token(_T_RBRACKET, "]", start_line, end_col))
+                    self.pos = end + 1
+                    self.column = end_col + 1
+                    return
+
         self._advance()  # Skip [
-        tokens.append(Token(TokenType.LBRACKET, "[", start_line, start_col))
+        append(Token(_T_LBRACKET, "[", start_line, start_col))
 
-        while self._current_char() is not None and self._current_char() != "]":
+        n = self._len
+        while self.pos < n and text[self.pos] != "]":
             self._skip_whitespace_on_line()
 
             # Skip newlines inside arrays
-            while self._current_char() == "\n":
+            while self.pos < n and text[self.pos] == "\n":
                 self._advance()
                 self._skip_whitespace_on_line()
 
-            if self._current_char() == "]":
+            if self.pos < n and text[self.pos] == "]":
                 break
 
             # Skip comments inside arrays
-            if self._current_char() == "#":
+            if self.pos < n and text[self.pos] == "#":
                 self._read_until("\n")
                 continue
 
             # Read value
-            val_tokens = self._read_value_token()
-            tokens.extend(val_tokens)
+            self._read_value_token(out)
 
             self._skip_whitespace_on_line()
 
             # Comma
-            if self._current_char() == ",":
-                tokens.append(Token(TokenType.COMMA, ",", self.line, self.column))
+            if self.pos < n and text[self.pos] == ",":
+                append(Token(_T_COMMA, ",", self.line, self.column))
                 self._advance()
 
         if self._current_char() == "]":
-            tokens.append(Token(TokenType.RBRACKET, "]", self.line, self.column))
+            append(Token(_T_RBRACKET, "]", self.line, self.column))
             self._advance()
 
+    def _lex_simple_array(
+        self, body: str, line: int, col: int
+    ) -> Optional[List[Token]]:
+        """Lex the comma-separated items of a simple inline array.
+
+        Returns the item and comma tokens, or None when an item needs
+        the full scanner (embedded whitespace splits a part into
+        several tokens on the slow path).
+        """
+        tokens: List[Token] = []
+        append = tokens.append
+        parts = body.split(",")
+        base = col + 1  # column of the first body character
+        offset = 0
+        last = len(parts) - 1
+        for i, part in enumerate(parts):
+            value = part.strip(" \t")
+            if value:
+                if " " in value or "\t" in value:
+                    return None
+                vcol = base + offset + (len(part) - len(part.lstrip(" \t")))
+                lower = value.lower()
+                if lower in ("true", "yes", "on"):
+                    append(Token(_T_BOOLEAN, "true", line, vcol))
+                elif lower in ("false", "no", "off"):
+                    append(Token(_T_BOOLEAN, "false", line, vcol))
+                elif lower in ("null", "none", "nil"):
+                    append(Token(_T_NULL, "null", line, vcol))
+                elif _maybe_number(value):
+                    try:
+                        if "." in value:
+                            float(value)
+                        else:
+                            int(value)
+                        append(Token(_T_NUMBER, value, line, vcol))
+                    except ValueError:
+                        append(Token(_T_STRING, value, line, vcol))
+                else:
+                    append(Token(_T_STRING, value, line, vcol))
+            if i != last:
+                append(Token(_T_COMMA, ",", line, base + offset + len(part)))
+            offset += len(part) + 1
         return tokens
 
-    def _read_value_token(self) -> List[Token]:
-        """Read a single value and return tokens."""
-        tokens = []
-        start_line = self.line
-        start_col = self.column
+    def _read_value_token(self, out: List[Token]) -> None:
+        """Read a single value, appending its tokens to ``out``.
 
-        char = self._current_char()
-
-        # String
-        if char in ('"', "'"):
-            value = self._read_string(char)
-            tokens.append(Token(TokenType.STRING, value, start_line, start_col))
-
-        # Array
-        elif char == "[":
-            tokens.extend(self._read_array())
-
-        # Environment variable
-        elif char == "$":
-            self._advance()  # Skip $
-            if self._current_char() == "e" and self.text[self.pos:self.pos+3] == "env":
-                self._advance(4)  # Skip 'env.'
-                name = ""
-                while self._current_char() and (self._current_char().isalnum() or self._current_char() == "_"):
-                    name += self._advance()
-                tokens.append(Token(TokenType.ENV_VAR, name, start_line, start_col))
-            elif self._current_char() == "s" and self.text[self.pos:self.pos+6] == "secret":
-                self._advance(7)  # Skip 'secret.'
-                name = ""
-                while self._current_char() and (self._current_char().isalnum() or self._current_char() == "_"):
-                    name += self._advance()
-                tokens.append(Token(TokenType.SECRET, name, start_line, start_col))
-            else:
-                raise LexerError(f"Invalid variable reference", line=start_line, column=start_col)
+        Appending straight into the caller's list avoids a temporary
+        list allocation (and extend copy) per value.
+        """
+        append = out.append
+        while True:
+            start_line = self.line
+            start_col = self.column
 
-        # Number or unquoted value
-        else:
-            value = ""
-            while self._current_char() and self._current_char() not in (" ", "\t", "\n", "#", ",", "]", "?"):
-                value += self._advance()
-
-            if not value:
-                return tokens
-
-            # Check for boolean
-            if value.lower() in ("true", "yes", "on"):
-                tokens.append(Token(TokenType.BOOLEAN, "true", start_line, start_col))
-            elif value.lower() in ("false", "no", "off"):
-                tokens.append(Token(TokenType.BOOLEAN, "false", start_line, start_col))
-            elif value.lower() in ("null", "none", "nil"):
-                tokens.append(Token(TokenType.NULL, "null", start_line, start_col))
+            char = self._current_char()
+
+            # String
+            if char in _QUOTES:
+                value = self._read_string(char)
+                append(Token(_T_STRING, value, start_line, start_col))
+
+            # Array
+            elif char == "[":
+                self._read_array(out)
+
+            # Environment variable
+            elif char == "$":
+                self._advance()  # Skip $
+                # Full prefixes with the trailing dot, so $envelope or
+                # $secretive raise instead of misparsing
+                if self.text.startswith("env.", self.pos):
+                    self._advance(4)  # Skip 'env.'
+                    name = self._read_name()
+                    append(Token(_T_ENV_VAR, name, start_line, start_col))
+                elif self.text.startswith("secret.", self.pos):
+                    self._advance(7)  # Skip 'secret.'
+                    name = self._read_name()
+                    append(Token(_T_SECRET, name, start_line, start_col))
+                else:
+                    raise LexerError(f"Invalid variable reference", line=start_line, column=start_col)
+
+            # Number or unquoted value
             else:
-                # Try number
-                try:
-                    if "." in value:
-                        float(value)
-                    else:
-                        int(value)
-                    tokens.append(Token(TokenType.NUMBER, value, start_line, start_col))
-                except ValueError:
-                    tokens.append(Token(TokenType.STRING, value, start_line, start_col))
-
-        # Check for default operator
-        self._skip_whitespace_on_line()
-        if self._current_char() == "?" and self._peek() == "?":
-            tokens.append(Token(TokenType.DEFAULT_OP, "??", self.line, self.column))
-            self._advance(2)
+                value = self._read_until(" \t\n#,]?")
+
+                if not value:
+                    return
+
+                # Check for boolean
+                if value.lower() in ("true", "yes", "on"):
+                    append(Token(_T_BOOLEAN, "true", start_line, start_col))
+                elif value.lower() in ("false", "no", "off"):
+                    append(Token(_T_BOOLEAN, "false", start_line, start_col))
+                elif value.lower() in ("null", "none", "nil"):
+                    append(Token(_T_NULL, "null", start_line, start_col))
+                elif _maybe_number(value):
+                    # Try number
+                    try:
+                        if "." in value:
+                            float(value)
+                        else:
+                            int(value)
+                        append(Token(_T_NUMBER, value, start_line, start_col))
+                    except ValueError:
+                        append(Token(_T_STRING, value, start_line, start_col))
+                else:
+                    append(Token(_T_STRING, value, start_line, start_col))
+
+            # Check for default operator; chained defaults (a ?? b ?? c)
+            # loop here instead of recursing
             self._skip_whitespace_on_line()
-            tokens.extend(self._read_value_token())
+            if self._current_char() == "?" and self._peek() == "?":
+                append(Token(_T_DEFAULT_OP, "??", self.line, self.column))
+                self._advance(2)
+                self._skip_whitespace_on_line()
+                continue
+            return
 
-        return tokens
+    def tokenize(self, skip_trivia: bool = False) -> List[Token]:
+        """Tokenize the entire text.
 
-    def tokenize(self) -> List[Token]:
-        """Tokenize the entire text."""
+        With ``skip_trivia`` COMMENT, NEWLINE and INDENT tokens are not
+        emitted at all; the parser only ever skips them, so leaving them
+        out lets it step straight between meaningful tokens.
+        """
         self.tokens = []
 
-        while self._current_char() is not None:
-            char = self._current_char()
+        # Local bindings keep the per-token loop free of attribute
+        # lookups and _current_char call overhead
+        text = self.text
+        n = self._len
+        append = self.tokens.append
+        while self.pos < n:
+            char = text[self.pos]
             start_line = self.line
             start_col = self.column
 
             # Newline
             if char == "\n":
-                self.tokens.append(Token(TokenType.NEWLINE, "\\n", start_line, start_col))
+                if not skip_trivia:
+                    append(Token(_T_NEWLINE, "\\n", start_line, start_col))
                 self._advance()
                 # Check for indentation
                 indent = self._skip_whitespace_on_line()
-                if indent > 0 and self._current_char() not in (None, "\n", "#"):
-                    self.tokens.append(Token(TokenType.INDENT, " " * indent, self.line, 1))
+                if (
+                    not skip_trivia
+                    and indent > 0
+                    and self.pos < n
+                    and text[self.pos] not in "\n#"
+                ):
+                    append(Token(_T_INDENT, " " * indent, self.line, 1))
                 continue
 
             # Whitespace (not at start of line)
-            if char in (" ", "\t"):
+            if char in _WS:
                 self._skip_whitespace_on_line()
                 continue
 
             # Comment
             if char == "#":
                 comment = self._read_until("\n").strip()
-                self.tokens.append(Token(TokenType.COMMENT, comment, start_line, start_col))
+                if not skip_trivia:
+                    append(Token(_T_COMMENT, comment, start_line, start_col))
                 continue
 
             # Section >> or >> @when
@@ -282,66 +479,62 @@ class Lexer:
                 self._skip_whitespace_on_line()
 
                 # Check for @when
-                if self._current_char() == "@" and self.text[self.pos:self.pos+5] == "@when":
+                if text.startswith("@when", self.pos):
                     self._advance(5)  # Skip @when
                     self._skip_whitespace_on_line()
                     condition = self._read_until("\n").strip()
-                    self.tokens.append(Token(TokenType.SECTION_WHEN, condition, start_line, start_col))
+                    append(Token(_T_SECTION_WHEN, condition, start_line, start_col))
                 else:
-                    name = self._read_until("\n#").strip()
-                    self.tokens.append(Token(TokenType.SECTION, name, start_line, start_col))
+                    name = sys.intern(self._read_until("\n#").strip())
+                    append(Token(_T_SECTION, name, start_line, start_col))
                 continue
 
             # Include @include
-            if char == "@" and self.text[self.pos:self.pos+8] == "@include":
+            if char == "@" and text.startswith("@include", self.pos):
                 self._advance(8)  # Skip @include
                 self._skip_whitespace_on_line()
                 # Read the file path
-                if self._current_char() in ('"', "'"):
+                if self._current_char() in _QUOTES:
                     path = self._read_string(self._current_char())
                 else:
                     path = self._read_until("\n#").strip()
-                self.tokens.append(Token(TokenType.INCLUDE, path, start_line, start_col))
+                append(Token(_T_INCLUDE, path, start_line, start_col))
                 continue
 
             # Key = value or key :: type = value
             if char.isalnum() or char == "_":
-                key = ""
-                while self._current_char() and (self._current_char().isalnum() or self._current_char() in ("_", "-")):
-                    key += self._advance()
-
-                self.tokens.append(Token(TokenType.KEY, key, start_line, start_col))
+                # Interned: the same keys repeat across sections, and
+                # interning makes downstream dict lookups pointer-fast
+                key = sys.intern(self._read_name("_-"))
+                append(Token(_T_KEY, key, start_line, start_col))
                 self._skip_whitespace_on_line()
 
                 # Type hint ::
                 if self._current_char() == ":" and self._peek() == ":":
                     self._advance(2)
                     self._skip_whitespace_on_line()
-                    type_name = ""
-                    while self._current_char() and self._current_char().isalnum():
-                        type_name += self._advance()
-                    self.tokens.append(Token(TokenType.TYPE_HINT, type_name, self.line, self.column))
+                    type_name = sys.intern(self._read_name(""))
+                    append(Token(_T_TYPE_HINT, type_name, self.line, self.column))
                     self._skip_whitespace_on_line()
 
                 # Equals
                 if self._current_char() == "=":
-                    self.tokens.append(Token(TokenType.EQUALS, "=", self.line, self.column))
+                    append(Token(_T_EQUALS, "=", self.line, self.column))
                     self._advance()
                     self._skip_whitespace_on_line()
 
                     # Value
-                    value_tokens = self._read_value_token()
-                    self.tokens.extend(value_tokens)
+                    self._read_value_token(self.tokens)
                 continue
 
             # Unknown character
             raise LexerError(f"Unexpected character: {char}", line=start_line, column=start_col)
 
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
+        append(Token(_T_EOF, "", self.line, self.column))
         return self.tokens
 
 
-def tokenize(text: str) -> List[Token]:
+def tokenize(text: str, skip_trivia: bool = False) -> List[Token]:
     """Convenience function to tokenize text."""
     lexer = Lexer(text)
-    return lexer.tokenize()
+    return lexer.tokenize(skip_trivia=skip_trivia)
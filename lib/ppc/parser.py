@@ -2,70 +2,228 @@
 pyPPC - Parser
 """
 
-from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 from .lexer import Token, TokenType, tokenize
 from .exceptions import ParseError
 
 
-@dataclass
+# Enum attribute access goes through EnumMeta and is comparatively
+# slow, so hot paths use these prebound members
+_T_BOOLEAN = TokenType.BOOLEAN
+_T_COMMA = TokenType.COMMA
+_T_COMMENT = TokenType.COMMENT
+_T_DEFAULT_OP = TokenType.DEFAULT_OP
+_T_ENV_VAR = TokenType.ENV_VAR
+_T_EOF = TokenType.EOF
+_T_EQUALS = TokenType.EQUALS
+_T_INCLUDE = TokenType.INCLUDE
+_T_INDENT = TokenType.INDENT
+_T_KEY = TokenType.KEY
+_T_LBRACKET = TokenType.LBRACKET
+_T_NEWLINE = TokenType.NEWLINE
+_T_NULL = TokenType.NULL
+_T_NUMBER = TokenType.NUMBER
+_T_RBRACKET = TokenType.RBRACKET
+_T_SECRET = TokenType.SECRET
+_T_SECTION = TokenType.SECTION
+_T_SECTION_WHEN = TokenType.SECTION_WHEN
+_T_STRING = TokenType.STRING
+_T_TYPE_HINT = TokenType.TYPE_HINT
+
+
+# AST nodes are plain __slots__ classes rather than dataclasses: large
+# configs allocate two nodes per assignment, and dropping the instance
+# dicts roughly halves their memory while keeping the attribute API
+
+
 class ValueNode:
     """Represents a value in the AST."""
-    value: Any
-    type_hint: Optional[str] = None
-    env_var: Optional[str] = None
-    secret: Optional[str] = None
-    default: Optional["ValueNode"] = None
-    line: int = 0
+
+    __slots__ = ("value", "type_hint", "env_var", "secret", "default", "line")
+
+    def __init__(
+        self,
+        value: Any,
+        type_hint: Optional[str] = None,
+        env_var: Optional[str] = None,
+        secret: Optional[str] = None,
+        default: Optional["ValueNode"] = None,
+        line: int = 0,
+    ):
+        self.value = value
+        self.type_hint = type_hint
+        self.env_var = env_var
+        self.secret = secret
+        self.default = default
+        self.line = line
+
+    def __repr__(self) -> str:
+        return (
+            f"ValueNode(value={self.value!r}, type_hint={self.type_hint!r}, "
+            f"env_var={self.env_var!r}, secret={self.secret!r}, "
+            f"default={self.default!r}, line={self.line})"
+        )
 
 
-@dataclass
 class AssignmentNode:
     """Represents a key = value assignment."""
-    key: str
-    value: ValueNode
-    line: int = 0
+
+    __slots__ = ("key", "value", "line")
+
+    def __init__(self, key: str, value: ValueNode, line: int = 0):
+        self.key = key
+        self.value = value
+        self.line = line
+
+    def __repr__(self) -> str:
+        return f"AssignmentNode(key={self.key!r}, value={self.value!r}, line={self.line})"
 
 
-@dataclass
 class SectionNode:
     """Represents a section >> name."""
-    name: str
-    assignments: List[AssignmentNode] = field(default_factory=list)
-    line: int = 0
+
+    __slots__ = ("name", "assignments", "line")
+
+    def __init__(
+        self,
+        name: str,
+        assignments: Optional[List[AssignmentNode]] = None,
+        line: int = 0,
+    ):
+        self.name = name
+        self.assignments = assignments if assignments is not None else []
+        self.line = line
+
+    def __repr__(self) -> str:
+        return (
+            f"SectionNode(name={self.name!r}, "
+            f"assignments={self.assignments!r}, line={self.line})"
+        )
 
 
-@dataclass
 class ConditionalNode:
     """Represents a conditional >> @when condition."""
-    condition: str
-    sections: List[SectionNode] = field(default_factory=list)
-    line: int = 0
+
+    __slots__ = ("condition", "sections", "line")
+
+    def __init__(
+        self,
+        condition: str,
+        sections: Optional[List[SectionNode]] = None,
+        line: int = 0,
+    ):
+        self.condition = condition
+        self.sections = sections if sections is not None else []
+        self.line = line
+
+    def __repr__(self) -> str:
+        return (
+            f"ConditionalNode(condition={self.condition!r}, "
+            f"sections={self.sections!r}, line={self.line})"
+        )
 
 
-@dataclass
 class IncludeNode:
     """Represents @include directive."""
-    path: str
-    line: int = 0
+
+    __slots__ = ("path", "line")
+
+    def __init__(self, path: str, line: int = 0):
+        self.path = path
+        self.line = line
+
+    def __repr__(self) -> str:
+        return f"IncludeNode(path={self.path!r}, line={self.line})"
 
 
-@dataclass
 class AST:
     """Abstract Syntax Tree for pyPPC."""
-    sections: List[SectionNode] = field(default_factory=list)
-    conditionals: List[ConditionalNode] = field(default_factory=list)
-    includes: List[IncludeNode] = field(default_factory=list)
+
+    __slots__ = ("sections", "conditionals", "includes")
+
+    def __init__(
+        self,
+        sections: Optional[List[SectionNode]] = None,
+        conditionals: Optional[List[ConditionalNode]] = None,
+        includes: Optional[List[IncludeNode]] = None,
+    ):
+        self.sections = sections if sections is not None else []
+        self.conditionals = conditionals if conditionals is not None else []
+        self.includes = includes if includes is not None else []
+
+    def __repr__(self) -> str:
+        return (
+            f"AST(sections={self.sections!r}, "
+            f"conditionals={self.conditionals!r}, includes={self.includes!r})"
+        )
+
+
+def _value_string(node: ValueNode, token: Token) -> None:
+    node.value = token.value
+
+
+def _value_number(node: ValueNode, token: Token) -> None:
+    if "." in token.value:
+        node.value = float(token.value)
+    else:
+        node.value = int(token.value)
+
+
+def _value_boolean(node: ValueNode, token: Token) -> None:
+    node.value = token.value == "true"
+
+
+def _value_null(node: ValueNode, token: Token) -> None:
+    node.value = None
+
+
+def _value_env(node: ValueNode, token: Token) -> None:
+    node.env_var = token.value
+    node.value = None
+
+
+def _value_secret(node: ValueNode, token: Token) -> None:
+    node.secret = token.value
+    node.value = None
+
+
+# Token type -> node filler, resolved with one dict lookup instead of an
+# if/elif ladder per value
+_VALUE_HANDLERS = {
+    _T_STRING: _value_string,
+    _T_NUMBER: _value_number,
+    _T_BOOLEAN: _value_boolean,
+    _T_NULL: _value_null,
+    _T_ENV_VAR: _value_env,
+    _T_SECRET: _value_secret,
+}
 
 
 class Parser:
     """Parses tokens into AST."""
 
     def __init__(self, tokens: List[Token]):
-        self.tokens = [t for t in tokens if t.type not in (TokenType.COMMENT, TokenType.NEWLINE)]
+        # Token streams from tokenize(skip_trivia=True) are used as-is;
+        # only rebuild the list when a caller hands us raw trivia
+        if any(
+            t.type is _T_COMMENT or t.type is _T_NEWLINE or t.type is _T_INDENT
+            for t in tokens
+        ):
+            tokens = [
+                t for t in tokens
+                if t.type not in (_T_COMMENT, _T_NEWLINE, _T_INDENT)
+            ]
+        self.tokens = tokens
         self.pos = 0
         self.current_section: Optional[SectionNode] = None
         self.current_conditional: Optional[ConditionalNode] = None
+        # Statement dispatch for the parse() loop, bound once per parser
+        self._statements = {
+            _T_SECTION: self._parse_section_statement,
+            _T_SECTION_WHEN: self._parse_conditional_statement,
+            _T_INCLUDE: self._parse_include_statement,
+            _T_KEY: self._parse_key_statement,
+        }
 
     def _current(self) -> Optional[Token]:
         if self.pos >= len(self.tokens):
@@ -83,10 +241,6 @@ class Parser:
         self.pos += 1
         return token
 
-    def _skip_indent(self):
-        while self._current() and self._current().type == TokenType.INDENT:
-            self._advance()
-
     def _expect(self, token_type: TokenType) -> Token:
         token = self._current()
         if token is None or token.type != token_type:
@@ -98,7 +252,6 @@ class Parser:
 
     def _parse_value(self) -> ValueNode:
         """Parse a value (possibly with default)."""
-        self._skip_indent()
         token = self._current()
 
         if token is None:
@@ -107,50 +260,18 @@ class Parser:
         node = ValueNode(value=None, line=token.line)
 
         # Array
-        if token.type == TokenType.LBRACKET:
+        if token.type == _T_LBRACKET:
             node.value = self._parse_array()
             return node
 
-        # Environment variable
-        if token.type == TokenType.ENV_VAR:
-            node.env_var = token.value
-            node.value = None
-            self._advance()
-
-        # Secret
-        elif token.type == TokenType.SECRET:
-            node.secret = token.value
-            node.value = None
-            self._advance()
-
-        # String
-        elif token.type == TokenType.STRING:
-            node.value = token.value
-            self._advance()
-
-        # Number
-        elif token.type == TokenType.NUMBER:
-            if "." in token.value:
-                node.value = float(token.value)
-            else:
-                node.value = int(token.value)
-            self._advance()
-
-        # Boolean
-        elif token.type == TokenType.BOOLEAN:
-            node.value = token.value == "true"
-            self._advance()
-
-        # Null
-        elif token.type == TokenType.NULL:
-            node.value = None
-            self._advance()
-
-        else:
+        handler = _VALUE_HANDLERS.get(token.type)
+        if handler is None:
             raise ParseError(f"Unexpected token: {token.type.name}", line=token.line)
+        handler(node, token)
+        self._advance()
 
         # Check for default operator
-        if self._current() and self._current().type == TokenType.DEFAULT_OP:
+        if self._current() and self._current().type == _T_DEFAULT_OP:
             self._advance()  # Skip ??
             node.default = self._parse_value()
 
@@ -158,15 +279,10 @@ class Parser:
 
     def _parse_array(self) -> List[Any]:
         """Parse an array value."""
-        self._expect(TokenType.LBRACKET)
+        self._expect(_T_LBRACKET)
         items = []
 
-        while self._current() and self._current().type != TokenType.RBRACKET:
-            self._skip_indent()
-
-            if self._current().type == TokenType.RBRACKET:
-                break
-
+        while self._current() and self._current().type != _T_RBRACKET:
             value_node = self._parse_value()
 
             # Extract raw value from node
@@ -177,25 +293,22 @@ class Parser:
             else:
                 items.append(value_node.value)
 
-            self._skip_indent()
-
-            if self._current() and self._current().type == TokenType.COMMA:
+            if self._current() and self._current().type == _T_COMMA:
                 self._advance()
 
-        self._expect(TokenType.RBRACKET)
+        self._expect(_T_RBRACKET)
         return items
 
     def _parse_assignment(self) -> AssignmentNode:
         """Parse a key = value assignment."""
-        self._skip_indent()
-        key_token = self._expect(TokenType.KEY)
+        key_token = self._expect(_T_KEY)
 
         type_hint = None
-        if self._current() and self._current().type == TokenType.TYPE_HINT:
+        if self._current() and self._current().type == _T_TYPE_HINT:
             type_hint = self._current().value
             self._advance()
 
-        self._expect(TokenType.EQUALS)
+        self._expect(_T_EQUALS)
 
         value_node = self._parse_value()
         value_node.type_hint = type_hint
@@ -206,66 +319,62 @@ class Parser:
             line=key_token.line
         )
 
+    def _parse_section_statement(self, ast: AST, token: Token) -> None:
+        """Handle ``>> name``."""
+        self.current_conditional = None
+        section = SectionNode(name=token.value, line=token.line)
+        self.current_section = section
+        ast.sections.append(section)
+        self._advance()
+
+    def _parse_conditional_statement(self, ast: AST, token: Token) -> None:
+        """Handle ``>> @when condition`` and its sections."""
+        conditional = ConditionalNode(condition=token.value, line=token.line)
+        self.current_conditional = conditional
+        self.current_section = None
+        ast.conditionals.append(conditional)
+        self._advance()
+
+        # Parse sections within conditional
+        while self._current() and self._current().type == _T_SECTION:
+            section = SectionNode(name=self._current().value, line=self._current().line)
+            self.current_section = section
+            conditional.sections.append(section)
+            self._advance()
+
+            # Parse assignments in this section
+            while self._current() and self._current().type == _T_KEY:
+                assignment = self._parse_assignment()
+                section.assignments.append(assignment)
+
+    def _parse_include_statement(self, ast: AST, token: Token) -> None:
+        """Handle ``@include path``."""
+        include = IncludeNode(path=token.value, line=token.line)
+        ast.includes.append(include)
+        self._advance()
+
+    def _parse_key_statement(self, ast: AST, token: Token) -> None:
+        """Handle an assignment within the current (or implicit root) section."""
+        assignment = self._parse_assignment()
+        if self.current_section:
+            self.current_section.assignments.append(assignment)
+        else:
+            # Global assignment - create implicit root section
+            if not ast.sections or ast.sections[0].name != "":
+                root_section = SectionNode(name="", line=token.line)
+                ast.sections.insert(0, root_section)
+            ast.sections[0].assignments.append(assignment)
+
     def parse(self) -> AST:
         """Parse tokens into AST."""
         ast = AST()
+        statements = self._statements
 
-        while self._current() and self._current().type != TokenType.EOF:
-            self._skip_indent()
+        while self._current() and self._current().type != _T_EOF:
             token = self._current()
-
-            if token is None or token.type == TokenType.EOF:
-                break
-
-            # Section
-            if token.type == TokenType.SECTION:
-                self.current_conditional = None
-                section = SectionNode(name=token.value, line=token.line)
-                self.current_section = section
-                ast.sections.append(section)
-                self._advance()
-
-            # Conditional section
-            elif token.type == TokenType.SECTION_WHEN:
-                conditional = ConditionalNode(condition=token.value, line=token.line)
-                self.current_conditional = conditional
-                self.current_section = None
-                ast.conditionals.append(conditional)
-                self._advance()
-
-                # Parse sections within conditional
-                self._skip_indent()
-                while self._current() and self._current().type == TokenType.SECTION:
-                    section = SectionNode(name=self._current().value, line=self._current().line)
-                    self.current_section = section
-                    conditional.sections.append(section)
-                    self._advance()
-
-                    # Parse assignments in this section
-                    self._skip_indent()
-                    while self._current() and self._current().type == TokenType.KEY:
-                        assignment = self._parse_assignment()
-                        section.assignments.append(assignment)
-                        self._skip_indent()
-
-            # Include
-            elif token.type == TokenType.INCLUDE:
-                include = IncludeNode(path=token.value, line=token.line)
-                ast.includes.append(include)
-                self._advance()
-
-            # Assignment (within current section)
-            elif token.type == TokenType.KEY:
-                assignment = self._parse_assignment()
-                if self.current_section:
-                    self.current_section.assignments.append(assignment)
-                else:
-                    # Global assignment - create implicit root section
-                    if not ast.sections or ast.sections[0].name != "":
-                        root_section = SectionNode(name="", line=token.line)
-                        ast.sections.insert(0, root_section)
-                    ast.sections[0].assignments.append(assignment)
-
+            handler = statements.get(token.type)
+            if handler is not None:
+                handler(ast, token)
             else:
                 self._advance()
 
@@ -274,6 +383,6 @@ class Parser:
 
 def parse(text: str) -> AST:
     """Convenience function to parse text into AST."""
-    tokens = tokenize(text)
+    tokens = tokenize(text, skip_trivia=True)
     parser = Parser(tokens)
     return parser.parse()
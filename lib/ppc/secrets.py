@@ -9,6 +9,15 @@ from pathlib import Path
 from typing import Dict, Optional, Callable
 from .exceptions import SecretError
 
+# orjson parses several times faster than stdlib json; use it when the
+# host application happens to have it installed (both accept bytes)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class SecretProvider:
     """Base class for secret providers."""
@@ -18,6 +27,40 @@ class SecretProvider:
         raise NotImplementedError
 
 
+# Successful (prefix, key) -> variable-name resolutions; cleared
+# wholesale when full, like the AST memo in _cache
+_ENV_NAME_CACHE: Dict[tuple, str] = {}
+_ENV_NAME_CACHE_MAX = 256
+
+
+def _resolve_env_name(prefix: str, key: str) -> Optional[str]:
+    """Resolve which environment variable holds ``key``, memoized.
+
+    Secrets are referenced repeatedly under the same keys, so the
+    f-string building and double environ probe only happen once per
+    (prefix, key). Only live resolutions are kept: misses are never
+    cached and a remembered name that no longer reads back is dropped
+    and re-probed, so variables exported (or moved) after the provider
+    was built are still picked up.
+    """
+    cache_key = (prefix, key)
+    name = _ENV_NAME_CACHE.get(cache_key)
+    if name is not None and os.environ.get(name):
+        return name
+
+    name = f"{prefix}{key}"
+    if not os.environ.get(name):
+        name = f"PEPECONFIG_SECRET_{key}"
+        if not os.environ.get(name):
+            _ENV_NAME_CACHE.pop(cache_key, None)
+            return None
+
+    if len(_ENV_NAME_CACHE) >= _ENV_NAME_CACHE_MAX:
+        _ENV_NAME_CACHE.clear()
+    _ENV_NAME_CACHE[cache_key] = name
+    return name
+
+
 class EnvSecretProvider(SecretProvider):
     """
     Provides secrets from environment variables.
@@ -28,17 +71,10 @@ class EnvSecretProvider(SecretProvider):
         self.prefix = prefix
 
     def get(self, key: str) -> Optional[str]:
-        # Try with prefix
-        value = os.environ.get(f"{self.prefix}{key}")
-        if value:
-            return value
-
-        # Try PEPECONFIG prefix
-        value = os.environ.get(f"PEPECONFIG_SECRET_{key}")
-        if value:
-            return value
-
-        return None
+        name = _resolve_env_name(self.prefix, key)
+        if name is None:
+            return None
+        return os.environ.get(name) or None
 
 
 class FileSecretProvider(SecretProvider):
@@ -50,6 +86,7 @@ class FileSecretProvider(SecretProvider):
     def __init__(self, path: Path):
         self.path = Path(path)
         self._secrets: Dict[str, str] = {}
+        self._mtime_ns: Optional[int] = None
         self._load()
 
     def _load(self) -> None:
@@ -57,14 +94,25 @@ class FileSecretProvider(SecretProvider):
             raise SecretError(f"Secrets file not found: {self.path}")
 
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                self._secrets = json.load(f)
-        except json.JSONDecodeError as e:
+            data = self.path.read_bytes()
+            self._mtime_ns = self.path.stat().st_mtime_ns
+            self._secrets = _json_loads(data)
+        except ValueError as e:
             raise SecretError(f"Invalid JSON in secrets file: {e}")
         except Exception as e:
             raise SecretError(f"Error reading secrets file: {e}")
 
+    def _maybe_reload(self) -> None:
+        """Re-parse the file only when its mtime has changed."""
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns != self._mtime_ns:
+            self._load()
+
     def get(self, key: str) -> Optional[str]:
+        self._maybe_reload()
         return self._secrets.get(key)
 
 
@@ -95,9 +143,26 @@ class ChainedSecretProvider(SecretProvider):
 
     def __init__(self, *providers: SecretProvider):
         self.providers = list(providers)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        # A leading DictSecretProvider is consulted through its dict
+        # directly (shared by reference, so set/delete stay visible),
+        # saving a provider method call on the highest-priority lookup.
+        # File and env providers stay in the loop: both are dynamic.
+        self._static: Optional[Dict[str, str]] = None
+        self._rest = self.providers
+        if self.providers and type(self.providers[0]) is DictSecretProvider:
+            self._static = self.providers[0]._secrets
+            self._rest = self.providers[1:]
 
     def get(self, key: str) -> Optional[str]:
-        for provider in self.providers:
+        static = self._static
+        if static is not None:
+            value = static.get(key)
+            if value is not None:
+                return value
+        for provider in self._rest:
             value = provider.get(key)
             if value is not None:
                 return value
@@ -105,6 +170,7 @@ class ChainedSecretProvider(SecretProvider):
 
     def add_provider(self, provider: SecretProvider) -> None:
         self.providers.append(provider)
+        self._refresh()
 
 
 def create_secret_provider(
@@ -2,6 +2,8 @@
 pyPPC - Type System
 """
 
+import re
+import sys
 from typing import Any, List, Union
 from enum import Enum
 from .exceptions import TypeError
@@ -19,67 +21,91 @@ class PPCType(Enum):
     @classmethod
     def from_string(cls, type_str: str) -> "PPCType":
         """Convert string to PPCType."""
-        type_map = {
-            "str": cls.STR,
-            "string": cls.STR,
-            "int": cls.INT,
-            "integer": cls.INT,
-            "float": cls.FLOAT,
-            "number": cls.FLOAT,
-            "bool": cls.BOOL,
-            "boolean": cls.BOOL,
-            "list": cls.LIST,
-            "array": cls.LIST,
-            "any": cls.ANY,
-        }
-        normalized = type_str.lower().strip()
-        if normalized not in type_map:
-            raise TypeError(f"Unknown type: {type_str}")
-        return type_map[normalized]
+        normalized = sys.intern(type_str.lower().strip())
+        try:
+            return _TYPE_MAP[normalized]
+        except KeyError:
+            raise TypeError(f"Unknown type: {normalized}")
+
+
+# Alias -> member, built once so from_string is a plain dict lookup
+_TYPE_MAP = {
+    "str": PPCType.STR,
+    "string": PPCType.STR,
+    "int": PPCType.INT,
+    "integer": PPCType.INT,
+    "float": PPCType.FLOAT,
+    "number": PPCType.FLOAT,
+    "bool": PPCType.BOOL,
+    "boolean": PPCType.BOOL,
+    "list": PPCType.LIST,
+    "array": PPCType.LIST,
+    "any": PPCType.ANY,
+}
+
+
+def _validate_any(value: Any, line: int) -> Any:
+    return value
 
 
-def validate_type(value: Any, expected_type: PPCType, line: int = None) -> Any:
-    """Validate and convert value to expected type."""
+def _validate_str(value: Any, line: int) -> str:
+    return str(value)
+
+
+def _validate_int(value: Any, line: int) -> int:
+    try:
+        if isinstance(value, bool):
+            raise ValueError()
+        return int(value)
+    except (ValueError, TypeError):
+        raise TypeError(f"Cannot convert '{value}' to int", line=line)
+
 
-    if expected_type == PPCType.ANY:
+def _validate_float(value: Any, line: int) -> float:
+    try:
+        if isinstance(value, bool):
+            raise ValueError()
+        return float(value)
+    except (ValueError, TypeError):
+        raise TypeError(f"Cannot convert '{value}' to float", line=line)
+
+
+def _validate_bool(value: Any, line: int) -> bool:
+    if isinstance(value, bool):
         return value
+    if isinstance(value, str):
+        lower = value.lower()
+        if lower in ("true", "yes", "on", "1"):
+            return True
+        if lower in ("false", "no", "off", "0"):
+            return False
+    raise TypeError(f"Cannot convert '{value}' to bool", line=line)
 
-    if expected_type == PPCType.STR:
-        return str(value)
 
-    if expected_type == PPCType.INT:
-        try:
-            if isinstance(value, bool):
-                raise ValueError()
-            return int(value)
-        except (ValueError, TypeError):
-            raise TypeError(f"Cannot convert '{value}' to int", line=line)
+def _validate_list(value: Any, line: int) -> list:
+    if isinstance(value, list):
+        return value
+    raise TypeError(f"Expected list, got {type(value).__name__}", line=line)
 
-    if expected_type == PPCType.FLOAT:
-        try:
-            if isinstance(value, bool):
-                raise ValueError()
-            return float(value)
-        except (ValueError, TypeError):
-            raise TypeError(f"Cannot convert '{value}' to float", line=line)
 
-    if expected_type == PPCType.BOOL:
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            lower = value.lower()
-            if lower in ("true", "yes", "on", "1"):
-                return True
-            if lower in ("false", "no", "off", "0"):
-                return False
-        raise TypeError(f"Cannot convert '{value}' to bool", line=line)
-
-    if expected_type == PPCType.LIST:
-        if isinstance(value, list):
-            return value
-        raise TypeError(f"Expected list, got {type(value).__name__}", line=line)
+# Expected type -> validator, one dict lookup per validation instead of
+# an equality-test chain over the enum members
+_VALIDATORS = {
+    PPCType.ANY: _validate_any,
+    PPCType.STR: _validate_str,
+    PPCType.INT: _validate_int,
+    PPCType.FLOAT: _validate_float,
+    PPCType.BOOL: _validate_bool,
+    PPCType.LIST: _validate_list,
+}
 
-    return value
+
+def validate_type(value: Any, expected_type: PPCType, line: int = None) -> Any:
+    """Validate and convert value to expected type."""
+    validator = _VALIDATORS.get(expected_type)
+    if validator is None:
+        return value
+    return validator(value, line)
 
 
 def infer_type(value: Any) -> PPCType:
@@ -97,6 +123,16 @@ def infer_type(value: Any) -> PPCType:
     return PPCType.ANY
 
 
+# Single-pass classifiers for parse_value, so the common non-numeric
+# case never pays for a raised-and-caught ValueError
+_INT_RE = re.compile(r"[+-]?\d+$")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?$")
+_BOOL_TRUE = frozenset(("true", "yes", "on"))
+_BOOL_FALSE = frozenset(("false", "no", "off"))
+_NULLS = frozenset(("null", "none", "nil"))
+_MAYBE_NUMERIC = frozenset("+-.0123456789")
+
+
 def parse_value(raw_value: str) -> Any:
     """Parse a raw string value into appropriate Python type."""
     stripped = raw_value.strip()
@@ -105,14 +141,16 @@ def parse_value(raw_value: str) -> Any:
     if not stripped:
         return ""
 
+    lower = stripped.lower()
+
     # Boolean
-    if stripped.lower() in ("true", "yes", "on"):
+    if lower in _BOOL_TRUE:
         return True
-    if stripped.lower() in ("false", "no", "off"):
+    if lower in _BOOL_FALSE:
         return False
 
     # None/null
-    if stripped.lower() in ("null", "none", "nil"):
+    if lower in _NULLS:
         return None
 
     # Quoted string
@@ -120,17 +158,21 @@ def parse_value(raw_value: str) -> Any:
        (stripped.startswith("'") and stripped.endswith("'")):
         return stripped[1:-1]
 
-    # Integer
-    try:
+    # Number: regexes classify the common forms without exceptions; the
+    # try/except only runs for rarities like "1_000" or "inf"
+    if _INT_RE.match(stripped):
         return int(stripped)
-    except ValueError:
-        pass
-
-    # Float
-    try:
+    if _FLOAT_RE.match(stripped):
         return float(stripped)
-    except ValueError:
-        pass
+    if stripped[0] in _MAYBE_NUMERIC or lower in ("inf", "infinity", "nan"):
+        try:
+            return int(stripped)
+        except ValueError:
+            pass
+        try:
+            return float(stripped)
+        except ValueError:
+            pass
 
     # Default to string
     return stripped